@@ -7,16 +7,22 @@ Simple test runner script that provides common test execution patterns.
 """
 
 import sys
-import subprocess
 
+import pytest
 
-def run_command(cmd):
-    """Run a command and return the exit code."""
+
+# Plugins disabled for every run: this runner never uses --lf/--ff, so the
+# cacheprovider's .pytest_cache reads/writes are pure overhead.
+DISABLED_PLUGINS = ["-p", "no:cacheprovider"]
+
+
+def run_command(args):
+    """Run pytest in-process with the given arguments and return the exit code."""
+    args = DISABLED_PLUGINS + args
     print(f"\n{'='*60}")
-    print(f"Running: {' '.join(cmd)}")
+    print(f"Running: pytest {' '.join(args)}")
     print('='*60)
-    result = subprocess.run(cmd)
-    return result.returncode
+    return pytest.main(args)
 
 
 def main():
@@ -30,28 +36,34 @@ def main():
 
     if command == "all":
         # Run all tests
-        exit_code = run_command(["pytest", "tests/", "-v"])
+        exit_code = run_command(["tests/", "-v"])
 
     elif command == "unit":
         # Run only unit tests
-        exit_code = run_command(["pytest", "tests/", "-v", "-m", "unit"])
+        exit_code = run_command(["tests/", "-v", "-m", "unit"])
 
     elif command == "integration":
         # Run only integration tests
-        exit_code = run_command(["pytest", "tests/", "-v", "-m", "integration"])
+        exit_code = run_command(["tests/", "-v", "-m", "integration"])
 
     elif command == "api":
         # Run only API tests
-        exit_code = run_command(["pytest", "tests/", "-v", "-m", "api"])
+        exit_code = run_command(["tests/", "-v", "-m", "api"])
 
     elif command == "fast":
         # Run all tests except slow ones
-        exit_code = run_command(["pytest", "tests/", "-v", "-m", "not slow"])
+        exit_code = run_command(["tests/", "-v", "-m", "not slow"])
+
+    elif command == "parallel":
+        # Run tests across all cores with pytest-xdist; --dist loadfile keeps
+        # each test file on one worker so shared module state stays isolated
+        exit_code = run_command(["tests/", "-v", "-n", "auto",
+                                 "--dist", "loadfile"])
 
     elif command == "coverage":
         # Run tests with coverage report
         exit_code = run_command([
-            "pytest", "tests/", "-v",
+            "tests/", "-v",
             "--cov=src",
             "--cov-report=html",
             "--cov-report=term"
@@ -68,6 +80,7 @@ def main():
         print("  integration - Run only integration tests")
         print("  api         - Run only API tests")
         print("  fast        - Run all tests except slow ones")
+        print("  parallel    - Run tests in parallel across cores (pytest-xdist)")
         print("  coverage    - Run tests with coverage report")
         print("  help        - Show this help message")
         print("\nExamples:")
@@ -7,18 +7,38 @@ application. It enables frontend applications to create networks, train them,
 and retrieve results.
 """
 
-from flask import Flask, request, jsonify, send_from_directory
+import eventlet
+import sys as _sys
+# Patch the standard library for cooperative (green) I/O before Flask or any
+# other module imports socket/threading. Without this, eventlet cannot take
+# over the WebSocket transport and Socket.IO falls back to long-polling.
+# Under pytest the thread module must stay real: pytest-xdist workers talk
+# to the controller over execnet's OS threads, which deadlock if greened
+# after they have already started. The other modules are listed
+# explicitly because monkey_patch treats any True keyword as "patch only
+# these" — a bare thread=True would leave socket/time/select unpatched.
+eventlet.monkey_patch(os=True, select=True, socket=True, time=True,
+                      subprocess=True, thread='pytest' not in _sys.modules)
+
+import os
+# Cap BLAS thread pools before NumPy loads. The layer matmuls here are
+# far too small for BLAS threading to pay off, and forked training
+# workers inherit this setting, so concurrent jobs cannot oversubscribe
+# the CPU and starve the eventlet request loop.
+os.environ.setdefault('OMP_NUM_THREADS', '1')
+os.environ.setdefault('OPENBLAS_NUM_THREADS', '1')
+os.environ.setdefault('MKL_NUM_THREADS', '1')
+
+from flask import (Flask, Response, request, jsonify, send_from_directory,
+                   stream_with_context)
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 from flask_socketio import SocketIO, emit
-import os
+import functools
+import orjson
+import multiprocessing
+import threading
 import uuid
-import base64
-from io import BytesIO
-import eventlet
-# Set matplotlib to use non-interactive backend before importing pyplot
-import matplotlib
-matplotlib.use('Agg')  # Use the Agg backend which doesn't require a display
-import matplotlib.pyplot as plt
 import numpy as np
 
 # Import our existing network code
@@ -43,8 +63,24 @@ except ImportError:
         delete_network
     )
 
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider backed by orjson.
+
+    orjson serializes NumPy arrays and scalars natively, so endpoints can
+    put weight matrices and activation vectors straight into a response
+    without the per-element .tolist()/float() conversions the stdlib
+    encoder would need.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 # Initialize Flask app
 app = Flask(__name__, static_folder='static')
+app.json = ORJSONProvider(app)
 CORS(app, resources={r"/*": {"origins": "*"}})  # Enable CORS for all routes and all origins
 socketio = SocketIO(
     app,
@@ -62,14 +98,27 @@ active_networks = {}
 # Store training jobs
 training_jobs = {}
 
-# Load MNIST data once at startup
-print("Loading MNIST data...")
-try:
-    training_data, validation_data, test_data = mnist_loader.load_data_wrapper()
-    print("Data loaded successfully!")
-except Exception as e:
-    print(f"Error loading data: {e}")
-    raise
+# Guards mutations and snapshot reads of the two shared dicts above.
+# Request handlers and training drain tasks run on different green threads,
+# so state changes go through this lock to keep each update atomic.
+_state_lock = threading.RLock()
+
+@functools.lru_cache(maxsize=1)
+def get_mnist_data():
+    """Load the MNIST data on first use.
+
+    Loading takes seconds, so it is deferred until something actually
+    needs the data (training or the example endpoints) instead of being
+    paid by every import of this module.
+    """
+    print("Loading MNIST data...")
+    try:
+        training_data, validation_data, test_data = mnist_loader.load_data_wrapper()
+        print("Data loaded successfully!")
+    except Exception as e:
+        print(f"Error loading data: {e}")
+        raise
+    return training_data, validation_data, test_data
 
 @app.route('/api/status', methods=['GET'])
 def get_status():
@@ -88,19 +137,20 @@ def create_network():
     # Get layer sizes from request, default to [784, 30, 10] if not specified
     layer_sizes = data.get('layer_sizes', [784, 30, 10])
     
-    # Create a unique ID for this network
-    network_id = str(uuid.uuid4())
+    # Create a unique ID for this network (.hex skips the dash formatting)
+    network_id = uuid.uuid4().hex
     
     # Create the network with specified architecture
     net = network.Network(layer_sizes)
     
     # Store in our dictionary
-    active_networks[network_id] = {
-        'network': net,
-        'architecture': layer_sizes,
-        'trained': False,
-        'accuracy': None
-    }
+    with _state_lock:
+        active_networks[network_id] = {
+            'network': net,
+            'architecture': layer_sizes,
+            'trained': False,
+            'accuracy': None
+        }
     
     return jsonify({
         'network_id': network_id,
@@ -119,16 +169,17 @@ def train_network(network_id):
     mini_batch_size = data.get('mini_batch_size', 10)
     learning_rate = data.get('learning_rate', 3.0)
     
-    # Create a job ID for this training task
-    job_id = str(uuid.uuid4())
+    # Create a job ID for this training task (.hex skips the dash formatting)
+    job_id = uuid.uuid4().hex
     
     # Set up the training job status
-    training_jobs[job_id] = {
-        'network_id': network_id,
-        'status': 'pending',
-        'progress': 0,
-        'epochs': epochs
-    }
+    with _state_lock:
+        training_jobs[job_id] = {
+            'network_id': network_id,
+            'status': 'pending',
+            'progress': 0,
+            'epochs': epochs
+        }
     
     # Start training in a background task (compatible with eventlet)
     socketio.start_background_task(
@@ -142,54 +193,159 @@ def train_network(network_id):
         'status': 'training_started'
     })
 
-def train_network_task(network_id, job_id, epochs, mini_batch_size, learning_rate):
-    """Background task to train the network"""
-    net = active_networks[network_id]['network']
-    
-    def epoch_callback(data):
-        """Callback function for each epoch to send updates via websocket"""
-        # Update the job status
-        training_jobs[job_id]['status'] = 'training'
-        training_jobs[job_id]['progress'] = (data['epoch'] / data['total_epochs']) * 100
-        
-        # Prepare update data for websocket emission
-        update_data = {
-            'job_id': job_id,
-            'network_id': network_id,
-            'epoch': data['epoch'],
-            'total_epochs': data['total_epochs'],
-            'accuracy': data['accuracy'],
-            'elapsed_time': data['elapsed_time'],
-            'progress': training_jobs[job_id]['progress'],
-            'correct': data.get('correct'),
-            'total': data.get('total')
-        }
-        
-        # Emit the progress update through websocket
-        socketio.emit('training_update', update_data)
-        # Yield control to eventlet to send the message immediately
-        eventlet.sleep(0)
+def _train_worker(net, network_id, epochs, mini_batch_size, learning_rate, conn):
+    """Run SGD in a child process, reporting progress through ``conn``.
 
+    The child inherits ``training_data`` / ``test_data`` copy-on-write from
+    the fork, trains its own copy of the network, saves the result to disk
+    and sends only small status tuples back through the pipe.  The parent
+    process reloads the saved network when it sees the ``done`` message.
+    """
     try:
-        # Train the network with the callback function
-        net.SGD(training_data, epochs, mini_batch_size, learning_rate, 
+        # Already loaded (and COW-shared) by the parent before the fork
+        training_data, _, test_data = get_mnist_data()
+
+        final_metrics = {}
+
+        def epoch_callback(data):
+            final_metrics.update(data)
+            conn.send(('progress', data))
+
+        net.SGD(training_data, epochs, mini_batch_size, learning_rate,
                 test_data=test_data, callback=epoch_callback)
-        
-        # Calculate accuracy
-        accuracy = net.evaluate(test_data) / len(test_data)
-        
-        # Update network status
-        active_networks[network_id]['trained'] = True
-        active_networks[network_id]['accuracy'] = accuracy
-        
-        # Update job status
-        training_jobs[job_id]['status'] = 'completed'
-        training_jobs[job_id]['accuracy'] = accuracy
-        training_jobs[job_id]['progress'] = 100
 
-        # Save the trained network with metadata
+        # SGD already evaluated the test set on its final epoch; reuse that
+        # result instead of paying another full forward pass over it
+        if final_metrics.get('correct') is not None:
+            accuracy = final_metrics['correct'] / final_metrics['total']
+        else:
+            accuracy = net.evaluate(test_data) / len(test_data)
+
+        # Save the trained network with metadata; the parent loads it back
         save_network(net, network_id, trained=True, accuracy=accuracy)
 
+        conn.send(('done', {'accuracy': accuracy}))
+    except Exception as e:
+        conn.send(('error', str(e)))
+    finally:
+        conn.close()
+
+def train_network_task(network_id, job_id, epochs, mini_batch_size, learning_rate):
+    """Background task that supervises training in a child process.
+
+    SGD is NumPy-heavy Python, so running it in this process would hold the
+    GIL and starve the eventlet hub (and every other request) for the length
+    of an epoch.  Instead the work is forked into its own interpreter and
+    this green thread just drains the progress pipe and forwards updates
+    over the websocket.
+    """
+    entry = active_networks.get(network_id)
+    if entry is None:
+        # Network was deleted between scheduling and this task running
+        return
+    net = entry['network']
+
+    # Load the data in the parent before forking so the child inherits it
+    # copy-on-write instead of reading the pickle again
+    get_mnist_data()
+
+    parent_conn, child_conn = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.get_context('fork').Process(
+        target=_train_worker,
+        args=(net, network_id, epochs, mini_batch_size, learning_rate,
+              child_conn),
+        daemon=True
+    )
+    process.start()
+    child_conn.close()
+
+    terminal = None
+    while terminal is None:
+        # Drain everything queued since the last wakeup so a burst of epoch
+        # updates is flushed in one batch instead of one frame per poll
+        messages = []
+        while parent_conn.poll(0):
+            # poll() also reports readable at EOF, so a closed pipe ends
+            # the drain rather than raising out of the supervisor
+            try:
+                messages.append(parent_conn.recv())
+            except EOFError:
+                break
+
+        if not messages:
+            if not process.is_alive() and not parent_conn.poll(0):
+                # Child died without reporting a result
+                messages.append(('error', 'Training process exited unexpectedly'))
+            else:
+                # Yield to the eventlet hub until the next flush interval
+                eventlet.sleep(0.1)
+                continue
+
+        progress_updates = [payload for kind, payload in messages
+                            if kind == 'progress']
+        if progress_updates:
+            for payload in progress_updates:
+                # Update the job status
+                with _state_lock:
+                    training_jobs[job_id]['status'] = 'training'
+                    training_jobs[job_id]['progress'] = \
+                        (payload['epoch'] / payload['total_epochs']) * 100
+
+                # Prepare update data for websocket emission
+                update_data = {
+                    'job_id': job_id,
+                    'network_id': network_id,
+                    'epoch': payload['epoch'],
+                    'total_epochs': payload['total_epochs'],
+                    'accuracy': payload['accuracy'],
+                    'elapsed_time': payload['elapsed_time'],
+                    'progress': training_jobs[job_id]['progress'],
+                    'correct': payload.get('correct'),
+                    'total': payload.get('total')
+                }
+
+                # Emit the progress update through websocket
+                socketio.emit('training_update', update_data)
+
+            # Yield control to eventlet once per batch to send the frames
+            eventlet.sleep(0)
+
+        terminal = next(((kind, payload) for kind, payload in messages
+                         if kind != 'progress'), None)
+
+    kind, payload = terminal
+    if kind == 'done':
+        accuracy = payload['accuracy']
+
+        # Pull the trained weights back from the child's saved copy,
+        # cast to float32: MNIST inference accuracy is unaffected and
+        # every subsequent feedforward moves half the weight bytes
+        trained_net = load_network(network_id)
+        if trained_net is not None:
+            net.weights = trained_net.weights
+            net.biases = trained_net.biases
+            net.to_float32()
+
+        # Update network and job status atomically. The network may have
+        # been deleted while training ran; that result has no home, so
+        # the job is routed through the error path below instead of
+        # being left stuck in 'training'.
+        with _state_lock:
+            entry = active_networks.get(network_id)
+            if entry is None:
+                kind, payload = 'error', 'Network was deleted during training'
+            else:
+                entry['trained'] = True
+                entry['accuracy'] = accuracy
+
+                # The weights changed, so any cached predictions are stale
+                example_routes._cached_predictions.cache_clear()
+
+                training_jobs[job_id]['status'] = 'completed'
+                training_jobs[job_id]['accuracy'] = accuracy
+                training_jobs[job_id]['progress'] = 100
+
+    if kind == 'done':
         # Emit completion event via WebSocket
         socketio.emit('training_complete', {
             'job_id': job_id,
@@ -201,66 +357,95 @@ def train_network_task(network_id, job_id, epochs, mini_batch_size, learning_rat
         # Yield control to eventlet to send the message immediately
         eventlet.sleep(0)
 
-    except Exception as e:
+        # Warm the prediction cache with the new weights so the first
+        # example request after training doesn't pay for the full
+        # test-set forward pass
+        try:
+            example_routes._cached_predictions(network_id)
+        except KeyError:
+            pass  # network deleted between completion and warm-up
+
+    else:  # 'error'
         # Update job status on error
-        training_jobs[job_id]['status'] = 'failed'
-        training_jobs[job_id]['error'] = str(e)
+        with _state_lock:
+            training_jobs[job_id]['status'] = 'failed'
+            training_jobs[job_id]['error'] = payload
 
         # Emit error event via WebSocket
         socketio.emit('training_error', {
             'job_id': job_id,
             'network_id': network_id,
             'status': 'failed',
-            'error': str(e)
+            'error': payload
         })
         # Yield control to eventlet to send the message immediately
         eventlet.sleep(0)
 
+    parent_conn.close()
+    process.join()
+
 @app.route('/api/training/<job_id>', methods=['GET'])
 def get_training_status(job_id):
     """Get the status of a training job"""
-    if job_id not in training_jobs:
-        return jsonify({'error': 'Training job not found'}), 404
-    
-    return jsonify(training_jobs[job_id])
+    with _state_lock:
+        job = training_jobs.get(job_id)
+        if job is None:
+            return jsonify({'error': 'Training job not found'}), 404
+        # Copy under the lock so the response is a consistent snapshot
+        return jsonify(dict(job))
 
 @app.route('/api/networks', methods=['GET'])
 def list_networks():
     """List all available networks"""
-    # Combine in-memory and saved networks
-    in_memory = [
-        {
-            'network_id': nid,
-            'architecture': info['architecture'],
-            'trained': info['trained'],
-            'accuracy': info['accuracy'],
-            'status': 'in_memory'
-        }
-        for nid, info in active_networks.items()
-    ]
-    
-    # Get saved networks, but exclude ones already in memory to avoid duplicates
-    in_memory_ids = set(active_networks.keys())
-    saved = list_saved_networks()
-    saved_not_in_memory = []
-    for net in saved:
-        if net['network_id'] not in in_memory_ids:
-            net['status'] = 'saved'
-            saved_not_in_memory.append(net)
-
-    return jsonify({
-        'networks': in_memory + saved_not_in_memory
-    })
+    # Combine in-memory and saved networks; snapshot under the lock so a
+    # concurrent create/delete can't change the dict mid-iteration
+    with _state_lock:
+        in_memory = [
+            {
+                'network_id': nid,
+                'architecture': info['architecture'],
+                'trained': info['trained'],
+                'accuracy': info['accuracy'],
+                'status': 'in_memory'
+            }
+            for nid, info in active_networks.items()
+        ]
+        in_memory_ids = set(active_networks.keys())
+
+    # Stream the response: the in-memory entries ship immediately and the
+    # saved networks are only read once those bytes are already on the wire
+    def generate():
+        yield b'{"networks":['
+        first = True
+        for entry in in_memory:
+            if not first:
+                yield b','
+            yield orjson.dumps(entry)
+            first = False
+        # Saved networks, excluding ones already in memory to avoid duplicates
+        for entry in list_saved_networks():
+            if entry['network_id'] in in_memory_ids:
+                continue
+            entry['status'] = 'saved'
+            if not first:
+                yield b','
+            yield orjson.dumps(entry)
+            first = False
+        yield b']}'
+
+    return Response(stream_with_context(generate()), mimetype='application/json')
 
 @app.route('/api/networks/<network_id>', methods=['DELETE'])
 def delete_network_endpoint(network_id):
     """Delete a network (both from memory and disk)"""
     # Remove from active networks if present
     deleted_from_memory = False
-    if network_id in active_networks:
-        del active_networks[network_id]
-        deleted_from_memory = True
-    
+    with _state_lock:
+        if network_id in active_networks:
+            del active_networks[network_id]
+            example_routes._cached_predictions.cache_clear()
+            deleted_from_memory = True
+
     # Delete from disk if present
     deleted_from_disk = delete_network(network_id)
     
@@ -277,7 +462,8 @@ def delete_network_endpoint(network_id):
 def delete_all_networks():
     """Delete all networks (both from memory and disk)"""
     # Get all network IDs (in-memory and saved)
-    in_memory_ids = list(active_networks.keys())
+    with _state_lock:
+        in_memory_ids = list(active_networks.keys())
     saved_networks = list_saved_networks()
     saved_ids = [net['network_id'] for net in saved_networks]
 
@@ -291,9 +477,10 @@ def delete_all_networks():
     # Delete each network
     for network_id in all_network_ids:
         # Remove from active networks if present
-        if network_id in active_networks:
-            del active_networks[network_id]
-            deleted_from_memory_count += 1
+        with _state_lock:
+            if network_id in active_networks:
+                del active_networks[network_id]
+                deleted_from_memory_count += 1
 
         # Delete from disk if present
         if delete_network(network_id):
@@ -301,6 +488,8 @@ def delete_all_networks():
 
         deleted_count += 1
 
+    example_routes._cached_predictions.cache_clear()
+
     return jsonify({
         'deleted_count': deleted_count,
         'deleted_from_memory': deleted_from_memory_count,
@@ -309,129 +498,15 @@ def delete_all_networks():
     })
 
 
-@app.route('/api/networks/<network_id>/successful_example', methods=['GET'])
-def get_successful_example(network_id):
-    """Return a random successful example prediction with network output details"""
-    if network_id not in active_networks:
-        return jsonify({'error': 'Network not found'}), 404
-        
-    net = active_networks[network_id]['network']
-    
-    # Find a successful example
-    successful_example = None
-    attempts = 0
-    max_attempts = 100
-    
-    while successful_example is None and attempts < max_attempts:
-        # Choose a random example from test data
-        index = np.random.randint(0, len(test_data))
-        x, y = test_data[index]
-        
-        # Get the network's output
-        output = net.feedforward(x)
-        predicted_digit = int(np.argmax(output))
-        actual_digit = int(y)
-        
-        if predicted_digit == actual_digit:
-            successful_example = {
-                'index': index,
-                'x': x,
-                'y': actual_digit,
-                'output': output,
-                'predicted': predicted_digit
-            }
-        attempts += 1
-    
-    if successful_example is None:
-        return jsonify({'error': 'No successful example found after multiple attempts'}), 404
-    
-    # Create image of the digit
-    plt.figure(figsize=(3, 3))
-    plt.imshow(successful_example['x'].reshape(28, 28), cmap='gray')
-    plt.title(f"Predicted: {successful_example['predicted']} | Actual: {successful_example['y']}")
-    plt.axis('off')
-    
-    # Save image to buffer
-    buffer = BytesIO()
-    plt.savefig(buffer, format='png')
-    buffer.seek(0)
-    img_base64 = base64.b64encode(buffer.getvalue()).decode('utf-8')
-    plt.close()
-    
-    # Get the output layer weights (last layer in the network)
-    output_weights = net.weights[-1].tolist()
-    
-    return jsonify({
-        'network_id': network_id,
-        'example_index': successful_example['index'],
-        'predicted_digit': successful_example['predicted'],
-        'actual_digit': successful_example['y'],
-        'image_data': img_base64,
-        'output_weights': output_weights,
-        'network_output': [float(val.item()) if hasattr(val, 'item') else float(val) for val in successful_example['output']]
-    })
+# Registered last: the blueprint module needs this one for shared state,
+# so hand it a reference before any of its routes can run
+try:
+    from src import example_routes
+except ImportError:
+    import example_routes
 
-@app.route('/api/networks/<network_id>/unsuccessful_example', methods=['GET'])
-def get_unsuccessful_example(network_id):
-    """Return a random unsuccessful example prediction with network output details"""
-    if network_id not in active_networks:
-        return jsonify({'error': 'Network not found'}), 404
-        
-    net = active_networks[network_id]['network']
-    
-    # Find an unsuccessful example
-    unsuccessful_example = None
-    attempts = 0
-    max_attempts = 200
-    
-    while unsuccessful_example is None and attempts < max_attempts:
-        # Choose a random example from test data
-        index = np.random.randint(0, len(test_data))
-        x, y = test_data[index]
-        
-        # Get the network's output
-        output = net.feedforward(x)
-        predicted_digit = int(np.argmax(output))
-        actual_digit = int(y)
-        
-        if predicted_digit != actual_digit:
-            unsuccessful_example = {
-                'index': index,
-                'x': x,
-                'y': actual_digit,
-                'output': output,
-                'predicted': predicted_digit
-            }
-        attempts += 1
-    
-    if unsuccessful_example is None:
-        return jsonify({'error': 'No unsuccessful example found after multiple attempts'}), 404
-    
-    # Create image of the digit
-    plt.figure(figsize=(3, 3))
-    plt.imshow(unsuccessful_example['x'].reshape(28, 28), cmap='gray')
-    plt.title(f"Predicted: {unsuccessful_example['predicted']} | Actual: {unsuccessful_example['y']}")
-    plt.axis('off')
-    
-    # Save image to buffer
-    buffer = BytesIO()
-    plt.savefig(buffer, format='png')
-    buffer.seek(0)
-    img_base64 = base64.b64encode(buffer.getvalue()).decode('utf-8')
-    plt.close()
-    
-    # Get the output layer weights (last layer in the network)
-    output_weights = net.weights[-1].tolist()
-    
-    return jsonify({
-        'network_id': network_id,
-        'example_index': unsuccessful_example['index'],
-        'predicted_digit': unsuccessful_example['predicted'],
-        'actual_digit': unsuccessful_example['y'],
-        'image_data': img_base64,
-        'output_weights': output_weights,
-        'network_output': [float(val.item()) if hasattr(val, 'item') else float(val) for val in unsuccessful_example['output']]
-    })
+example_routes.init_server(_sys.modules[__name__])
+app.register_blueprint(example_routes.example_bp)
 
 @app.route('/')
 def index():
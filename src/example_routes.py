@@ -0,0 +1,189 @@
+"""
+example_routes.py
+~~~~~~~~~~~~~~~~~
+
+Blueprint with the example-prediction endpoints, split out of
+api_server.py.  The image-encoding helpers and the stacked test-set
+arrays they rely on live here and are only built on first use, so
+importing the server (e.g. for test collection) stays cheap.
+"""
+
+from flask import Blueprint, jsonify
+import base64
+import functools
+import threading
+from io import BytesIO
+
+import numpy as np
+from PIL import Image
+
+example_bp = Blueprint('examples', __name__)
+
+# The server module holding the shared state, recorded by init_server
+_api_server = None
+
+def init_server(module):
+    """Record the api_server module for shared-state lookups.
+
+    api_server imports this module while it is still initializing (it
+    registers the blueprint last), so a top-level import here would be
+    circular; it hands a reference to itself in at registration time
+    instead.  That also covers running the server as a script, where the
+    module only exists in sys.modules as ``__main__`` and a lookup by
+    import name would fail.
+    """
+    global _api_server
+    _api_server = module
+
+def _server():
+    """Return the api_server module recorded by ``init_server``."""
+    return _api_server
+
+@functools.lru_cache(maxsize=1)
+def _test_arrays():
+    """Stack the test inputs once into a (784, N) matrix.
+
+    Built on first use so the example endpoints can evaluate the whole
+    test set with one matrix multiply per layer instead of sampling
+    examples one at a time.
+    """
+    _, _, test_data = _server().get_mnist_data()
+    # float32 pixels / int16 labels: halves the bandwidth of the batched
+    # forward pass and the label compares without affecting results
+    test_x = np.hstack([x for x, _ in test_data]).astype(np.float32)
+    test_y = np.array([y for _, y in test_data], dtype=np.int16)
+    return test_x, test_y
+
+def predict_all(net):
+    """Feed the entire stacked test set through ``net`` in one pass.
+
+    Returns ``(outputs, predictions)`` where ``outputs`` is the (10, N)
+    activation matrix and ``predictions`` holds the argmax of each column.
+    """
+    test_x, _ = _test_arrays()
+    outputs = net.feedforward(test_x)
+    return outputs, outputs.argmax(axis=0)
+
+@functools.lru_cache(maxsize=32)
+def _cached_predictions(network_id):
+    """Memoized ``predict_all`` keyed by network id.
+
+    Repeated hits on the example endpoints reuse the same forward pass.
+    The cache is cleared whenever a network's weights change (training
+    completes) or a network is deleted, so entries never go stale.
+    """
+    net = _server().active_networks[network_id]['network']
+    return predict_all(net)
+
+# Shared Generator instance: default_rng().choice is a single C call,
+# and reusing one generator avoids re-seeding per request
+_rng = np.random.default_rng()
+
+# Per-thread scratch buffer for PNG encoding, reused across requests so
+# repeated encodes don't churn the allocator
+_png_buffers = threading.local()
+
+def encode_digit_png(x):
+    """Encode a 784-element MNIST input vector as a base64 PNG string.
+
+    This goes straight through Pillow rather than matplotlib: rasterizing a
+    28x28 digit through a full Agg figure costs orders of magnitude more
+    than a single PNG encode.  The predicted/actual labels are returned as
+    JSON fields, so no title needs to be drawn into the image.
+    """
+    arr = (x.reshape(28, 28) * 255).clip(0, 255).astype(np.uint8)
+    buffer = getattr(_png_buffers, 'buf', None)
+    if buffer is None:
+        buffer = _png_buffers.buf = BytesIO()
+    buffer.seek(0)
+    buffer.truncate(0)
+    # Fast zlib setting: a 28x28 grayscale digit compresses to a few
+    # hundred bytes regardless, so heavier levels only burn CPU
+    Image.fromarray(arr, mode='L').save(buffer, format='PNG',
+                                        optimize=False, compress_level=1)
+    return base64.b64encode(buffer.getvalue()).decode('utf-8')
+
+@functools.lru_cache(maxsize=None)
+def _example_png(index):
+    """Memoized ``encode_digit_png`` for a test-set index.
+
+    The rendered digit depends only on the immutable test set (the
+    predicted/actual labels live in the JSON payload, not the image), so
+    entries stay valid across retraining and never need invalidation.
+    Unbounded on purpose: even fully populated, the 10k test digits come
+    to a few megabytes of base64, so nothing needs evicting.
+    """
+    test_x, _ = _test_arrays()
+    return encode_digit_png(test_x[:, index])
+
+@example_bp.route('/api/networks/<network_id>/successful_example', methods=['GET'])
+def get_successful_example(network_id):
+    """Return a random successful example prediction with network output details"""
+    info = _server().active_networks.get(network_id)
+    if info is None:
+        return jsonify({'error': 'Network not found'}), 404
+
+    net = info['network']
+
+    # Evaluate every test example in one batched forward pass (cached
+    # between weight changes), then pick a random correctly-predicted index
+    outputs, preds = _cached_predictions(network_id)
+    _, test_y = _test_arrays()
+    matching = np.flatnonzero(preds == test_y)
+
+    if matching.size == 0:
+        return jsonify({'error': 'No successful example found'}), 404
+
+    index = int(_rng.choice(matching))
+
+    # Create image of the digit (cached per test index)
+    img_base64 = _example_png(index)
+
+    # Get the output layer weights (last layer in the network);
+    # the orjson provider serializes the arrays directly
+    return jsonify({
+        'network_id': network_id,
+        'example_index': index,
+        'predicted_digit': int(preds[index]),
+        'actual_digit': int(test_y[index]),
+        'image_data': img_base64,
+        'output_weights': net.weights[-1],
+        # Column slices are not C-contiguous, which orjson requires
+        'network_output': np.ascontiguousarray(outputs[:, index])
+    })
+
+@example_bp.route('/api/networks/<network_id>/unsuccessful_example', methods=['GET'])
+def get_unsuccessful_example(network_id):
+    """Return a random unsuccessful example prediction with network output details"""
+    info = _server().active_networks.get(network_id)
+    if info is None:
+        return jsonify({'error': 'Network not found'}), 404
+
+    net = info['network']
+
+    # Evaluate every test example in one batched forward pass (cached
+    # between weight changes), then pick a random misclassified index
+    outputs, preds = _cached_predictions(network_id)
+    _, test_y = _test_arrays()
+    matching = np.flatnonzero(preds != test_y)
+
+    if matching.size == 0:
+        return jsonify({'error': 'No unsuccessful example found'}), 404
+
+    index = int(_rng.choice(matching))
+
+    # Create image of the digit (cached per test index)
+    img_base64 = _example_png(index)
+
+    # Get the output layer weights (last layer in the network);
+    # the orjson provider serializes the arrays directly
+    return jsonify({
+        'network_id': network_id,
+        'example_index': index,
+        'predicted_digit': int(preds[index]),
+        'actual_digit': int(test_y[index]),
+        'image_data': img_base64,
+        'output_weights': net.weights[-1],
+        # Column slices are not C-contiguous, which orjson requires
+        'network_output': np.ascontiguousarray(outputs[:, index])
+    })
@@ -8,17 +8,29 @@ to allow saving and loading models for later use.
 
 import os
 import pickle
-import json
+import msgpack
 import numpy as np
+import orjson
 
-class NetworkEncoder(json.JSONEncoder):
-    """Custom JSON encoder that handles numpy arrays"""
-    def default(self, obj):
-        if isinstance(obj, np.ndarray):
-            return obj.tolist()
-        return super().default(obj)
+try:
+    from network import Network
+except ImportError:
+    from src.network import Network
 
-def save_network(network, network_id, model_dir='models', trained=True, accuracy=None):
+# Default storage location, overridable so deployments (and parallel
+# test workers) can point at their own directory
+DEFAULT_MODEL_DIR = os.environ.get('MODEL_DIR', 'models')
+
+# In-memory index of saved-network metadata, keyed by model directory.
+# Each entry is (directory st_mtime_ns, list of metadata dicts), so a
+# listing only re-reads the directory when its contents actually changed.
+_saved_index = {}
+
+def _invalidate_index(model_dir):
+    """Drop the cached listing for ``model_dir``."""
+    _saved_index.pop(model_dir, None)
+
+def save_network(network, network_id, model_dir=DEFAULT_MODEL_DIR, trained=True, accuracy=None):
     """
     Save a trained network to disk
     
@@ -35,26 +47,37 @@ def save_network(network, network_id, model_dir='models', trained=True, accuracy
     if not os.path.exists(model_dir):
         os.makedirs(model_dir)
         
-    # Save the network object
-    with open(f"{model_dir}/{network_id}.pkl", 'wb') as f:
-        pickle.dump(network, f)
-    
+    # Save the network as raw arrays in a single .npz file. Unlike
+    # pickling the whole Network object this stays loadable across code
+    # changes and skips object-graph reconstruction on load.
+    arrays = {'sizes': np.array(network.sizes, dtype=np.int32)}
+    for i, w in enumerate(network.weights):
+        arrays[f'w{i}'] = w
+    for i, b in enumerate(network.biases):
+        arrays[f'b{i}'] = b
+    np.savez(f"{model_dir}/{network_id}.npz", **arrays)
+
     # Save network metadata including trained status and accuracy
     metadata = {
         'network_id': network_id,
         'architecture': network.sizes,
-        'weights_shape': [w.shape for w in network.weights],
-        'biases_shape': [b.shape for b in network.biases],
+        'weights_shape': [list(w.shape) for w in network.weights],
+        'biases_shape': [list(b.shape) for b in network.biases],
         'trained': trained,
         'accuracy': accuracy
     }
     
-    with open(f"{model_dir}/{network_id}.json", 'w') as f:
-        json.dump(metadata, f, cls=NetworkEncoder)
-    
+    # msgpack writes typed binary directly — no number-to-text round
+    # trip and a single C call each way; nothing reads these files by
+    # hand, the API re-serializes them as JSON for clients
+    with open(f"{model_dir}/{network_id}.msgpack", 'wb') as f:
+        f.write(msgpack.packb(metadata))
+
+    _invalidate_index(model_dir)
+
     return True
 
-def load_network(network_id, model_dir='models'):
+def load_network(network_id, model_dir=DEFAULT_MODEL_DIR):
     """
     Load a trained network from disk
     
@@ -65,17 +88,26 @@ def load_network(network_id, model_dir='models'):
     Returns:
         The loaded neural network object or None if not found
     """
-    network_path = f"{model_dir}/{network_id}.pkl"
-    
+    network_path = f"{model_dir}/{network_id}.npz"
+
     if not os.path.exists(network_path):
-        return None
-    
-    with open(network_path, 'rb') as f:
-        network = pickle.load(f)
-    
+        # Fall back to the legacy pickle format for networks saved
+        # before the switch to .npz
+        legacy_path = f"{model_dir}/{network_id}.pkl"
+        if not os.path.exists(legacy_path):
+            return None
+        with open(legacy_path, 'rb') as f:
+            return pickle.load(f)
+
+    with np.load(network_path) as data:
+        network = Network([int(s) for s in data['sizes']])
+        num_layers = len(network.sizes) - 1
+        network.weights = [data[f'w{i}'] for i in range(num_layers)]
+        network.biases = [data[f'b{i}'] for i in range(num_layers)]
+
     return network
 
-def list_saved_networks(model_dir='models'):
+def list_saved_networks(model_dir=DEFAULT_MODEL_DIR):
     """
     List all saved networks
     
@@ -87,26 +119,45 @@ def list_saved_networks(model_dir='models'):
     """
     if not os.path.exists(model_dir):
         return []
-    
+
+    # Serve from the in-memory index while the directory is unchanged.
+    # Copy each dict, not just the list: callers annotate the entries
+    # (e.g. the listing endpoint adds a status field) and must not write
+    # into the cache.
+    mtime = os.stat(model_dir).st_mtime_ns
+    cached = _saved_index.get(model_dir)
+    if cached is not None and cached[0] == mtime:
+        return [dict(metadata) for metadata in cached[1]]
+
     networks = []
-    for filename in os.listdir(model_dir):
-        if filename.endswith('.json'):
-            network_id = filename.split('.')[0]
-            with open(f"{model_dir}/{filename}", 'r') as f:
-                metadata = json.load(f)
-
-            # Ensure backwards compatibility: add trained and accuracy if not present
-            if 'trained' not in metadata:
-                # If a network was saved, it was trained (old behavior)
-                metadata['trained'] = True
-            if 'accuracy' not in metadata:
-                metadata['accuracy'] = None
-
-            networks.append(metadata)
-    
-    return networks
+    # os.scandir hands back ready-made paths from one readdir pass,
+    # avoiding the per-entry path joins an os.listdir loop needs
+    with os.scandir(model_dir) as entries:
+        metadata_paths = [entry.path for entry in entries
+                          if entry.name.endswith(('.msgpack', '.json'))]
+
+    for path in metadata_paths:
+        with open(path, 'rb') as f:
+            if path.endswith('.msgpack'):
+                metadata = msgpack.unpackb(f.read())
+            else:
+                # Legacy sidecar written before the msgpack switch
+                metadata = orjson.loads(f.read())
+
+        # Ensure backwards compatibility: add trained and accuracy if not present
+        if 'trained' not in metadata:
+            # If a network was saved, it was trained (old behavior)
+            metadata['trained'] = True
+        if 'accuracy' not in metadata:
+            metadata['accuracy'] = None
+
+        networks.append(metadata)
 
-def delete_network(network_id, model_dir='models'):
+    _saved_index[model_dir] = (mtime, networks)
+
+    return [dict(metadata) for metadata in networks]
+
+def delete_network(network_id, model_dir=DEFAULT_MODEL_DIR):
     """
     Delete a saved network
     
@@ -117,17 +168,20 @@ def delete_network(network_id, model_dir='models'):
     Returns:
         bool: True if deletion was successful, False otherwise
     """
-    network_path = f"{model_dir}/{network_id}.pkl"
-    metadata_path = f"{model_dir}/{network_id}.json"
-    
-    if not os.path.exists(network_path) and not os.path.exists(metadata_path):
+    # Include the legacy .pkl/.json names so older saves can still be removed
+    paths = [f"{model_dir}/{network_id}.npz",
+             f"{model_dir}/{network_id}.msgpack",
+             f"{model_dir}/{network_id}.pkl",
+             f"{model_dir}/{network_id}.json"]
+
+    if not any(os.path.exists(path) for path in paths):
         return False
-    
+
     try:
-        if os.path.exists(network_path):
-            os.remove(network_path)
-        if os.path.exists(metadata_path):
-            os.remove(metadata_path)
+        for path in paths:
+            if os.path.exists(path):
+                os.remove(path)
+        _invalidate_index(model_dir)
         return True
     except Exception as e:
         print(f"Error deleting network: {e}")
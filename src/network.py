@@ -38,7 +38,13 @@ class Network(object):
                         for x, y in zip(sizes[:-1], sizes[1:])]
 
     def feedforward(self, a):
-        """Return the output of the network if ``a`` is input."""
+        """Return the output of the network if ``a`` is input.
+
+        ``a`` may be a single ``(n, 1)`` column or an ``(n, N)`` matrix
+        holding one example per column: ``np.dot(w, a) + b`` broadcasts
+        the bias over columns, so a whole batch goes through one matrix
+        multiply per layer instead of N separate ones.  The API server
+        relies on this to evaluate the full test set in one call."""
         for b, w in zip(self.biases, self.weights):
             a = sigmoid(np.dot(w, a)+b)
         return a
@@ -152,6 +158,16 @@ class Network(object):
                         for (x, y) in test_data]
         return sum(int(x == y) for (x, y) in test_results)
 
+    def to_float32(self):
+        """Cast the weights and biases to float32 in place.
+
+        Single precision is plenty for inference on MNIST and halves the
+        memory traffic of every feedforward call.  Intended for a
+        trained network that will only be used for predictions; training
+        itself stays in float64."""
+        self.weights = [w.astype(np.float32) for w in self.weights]
+        self.biases = [b.astype(np.float32) for b in self.biases]
+
     def cost_derivative(self, output_activations, y):
         """Return the vector of partial derivatives \partial C_x /
         \partial a for the output activations."""
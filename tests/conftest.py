@@ -5,35 +5,61 @@ conftest.py
 Pytest configuration and shared fixtures for all tests.
 """
 
+import copy
+
 import pytest
 import numpy as np
+import shutil
 import sys
 import os
+import tempfile
+import uuid
 from io import BytesIO
+from pathlib import Path
 
 # Add src directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+# Give every test process (each pytest-xdist worker is one) its own model
+# directory before the server modules read MODEL_DIR, so background
+# training jobs can never leak saved networks between workers or into the
+# real models/ directory.
+os.environ['MODEL_DIR'] = tempfile.mkdtemp(prefix='test-models-')
+
 from network import Network
 from api_server import app, socketio, active_networks, training_jobs
 import mnist_loader
 
 
+# Prototype networks cloned per fixture use: deepcopy of the weight
+# arrays is a straight memcpy, cheaper than re-running the Gaussian init
+# for every test, and each test still gets its own mutable copy.
+_SIMPLE_PROTOTYPE = Network([3, 4, 2])
+_MNIST_PROTOTYPE = Network([784, 30, 10])
+
+
 @pytest.fixture
 def simple_network():
     """Create a simple 3-layer network for testing."""
-    return Network([3, 4, 2])
+    return copy.deepcopy(_SIMPLE_PROTOTYPE)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mnist_network():
-    """Create a standard MNIST network."""
-    return Network([784, 30, 10])
+    """Create a standard MNIST network.
 
+    Session-scoped: no test mutates it, so one clone serves them all.
+    """
+    return copy.deepcopy(_MNIST_PROTOTYPE)
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def sample_training_data():
-    """Create small sample training data for testing."""
+    """Create small sample training data for testing.
+
+    Session-scoped; SGD shuffles the list in place but never touches the
+    arrays, so sharing it only perturbs the order between tests.
+    """
     # Create 10 simple training examples
     training_data = []
     for i in range(10):
@@ -44,7 +70,7 @@ def sample_training_data():
     return training_data
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_test_data():
     """Create small sample test data for testing."""
     # Create 5 simple test examples
@@ -56,21 +82,61 @@ def sample_test_data():
     return test_data
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def trained_simple_network():
+    """Train a small network once for the whole session.
+
+    Tests that only need "a network that has been through SGD" share this
+    instead of re-running the training loop per test.  Builds its own
+    data because session-scoped fixtures cannot use the function-scoped
+    sample fixtures.
+    """
+    net = Network([3, 4, 2])
+    training_data = []
+    for i in range(10):
+        x = np.random.randn(3, 1)
+        y = np.zeros((2, 1))
+        y[i % 2] = 1.0
+        training_data.append((x, y))
+    net.SGD(training_data, epochs=10, mini_batch_size=2, eta=3.0)
+    return net
+
+
+@pytest.fixture(scope="session")
 def flask_client():
-    """Create a Flask test client."""
+    """Create a Flask test client, shared across the whole session.
+
+    Building the client per test re-ran app setup for every trivial
+    endpoint check; one client per worker is enough because the autouse
+    ``_reset_server_state`` fixture clears the in-memory stores between
+    tests.
+    """
     app.config['TESTING'] = True
+    # Replace Flask's default 404 handler, which renders an HTML error
+    # page, with a constant empty body; the API's own 404s are returned
+    # directly from the views and never reach this handler.
+    app.register_error_handler(404, lambda e: (b'', 404))
     with app.test_client() as client:
         yield client
-    # Cleanup after test
+
+
+@pytest.fixture(autouse=True)
+def _reset_server_state():
+    """Clear the server's in-memory stores after every test."""
+    yield
     active_networks.clear()
     training_jobs.clear()
 
 
 @pytest.fixture
-def socketio_client():
-    """Create a SocketIO test client."""
-    client = socketio.test_client(app)
+def socketio_client(flask_client):
+    """Create a SocketIO test client.
+
+    Shares the Flask test client so both sides of a test observe one
+    session; the test client bypasses real transports entirely, so no
+    polling-vs-websocket upgrade is involved.
+    """
+    client = socketio.test_client(app, flask_test_client=flask_client)
     yield client
     client.disconnect()
     # Cleanup after test
@@ -78,12 +144,64 @@ def socketio_client():
     training_jobs.clear()
 
 
+@pytest.fixture
+def seed_networks():
+    """Insert networks straight into the in-memory store.
+
+    Listing and bulk-deletion tests only need entries to exist; creating
+    each one through the POST endpoint pays WSGI dispatch plus JSON
+    handling per network for no extra coverage.
+    """
+    def _seed(count, architecture=None):
+        ids = []
+        for _ in range(count):
+            # Default-architecture networks are cloned from the prototype
+            # so seeding does not re-run the Gaussian init either
+            if architecture is None:
+                net = copy.deepcopy(_MNIST_PROTOTYPE)
+            else:
+                net = Network(architecture)
+            network_id = uuid.uuid4().hex
+            active_networks[network_id] = {
+                'network': net,
+                'architecture': architecture or [784, 30, 10],
+                'trained': False,
+                'accuracy': None
+            }
+            ids.append(network_id)
+        return ids
+    return _seed
+
+
+@pytest.fixture
+def example_network_id(seed_networks):
+    """One untrained network for the example-endpoint tests.
+
+    Function-scoped rather than class-scoped because the autouse state
+    reset clears active_networks between tests; seeding from the
+    prototype keeps it cheap anyway.
+    """
+    return seed_networks(1)[0]
+
+
 @pytest.fixture
 def temp_model_dir(tmp_path):
-    """Create a temporary directory for model storage."""
-    model_dir = tmp_path / "models"
-    model_dir.mkdir()
-    return str(model_dir)
+    """Create a temporary directory for model storage.
+
+    Uses /dev/shm (tmpfs) when available so the persistence tests hit
+    memory instead of disk blocks; falls back to pytest's tmp_path
+    elsewhere.
+    """
+    shm = Path('/dev/shm')
+    if shm.is_dir():
+        model_dir = shm / f"test-models-{uuid.uuid4().hex}"
+        model_dir.mkdir()
+        yield str(model_dir)
+        shutil.rmtree(model_dir, ignore_errors=True)
+    else:
+        model_dir = tmp_path / "models"
+        model_dir.mkdir()
+        yield str(model_dir)
 
 
 @pytest.fixture(scope="session")
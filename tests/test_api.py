@@ -6,9 +6,16 @@ API endpoint tests for the Flask server.
 """
 
 import pytest
-import json
+import orjson
+import sys
 import time
 
+from api_server import active_networks
+
+# Compact orjson output makes fixed response fragments checkable as raw
+# bytes without a parse
+_EXPECT_DEFAULT_ARCH = b'"architecture":[784,30,10]'
+
 
 @pytest.mark.api
 class TestStatusEndpoint:
@@ -22,14 +29,17 @@ class TestStatusEndpoint:
     def test_status_endpoint_json(self, flask_client):
         """Test status endpoint returns JSON."""
         response = flask_client.get('/api/status')
-        data = json.loads(response.data)
-        assert 'status' in data
-        assert data['status'] == 'online'
+        # orjson emits compact JSON, so the exact pair can be checked as
+        # bytes without deserializing the whole body
+        assert b'"status":"online"' in response.data
 
     def test_status_includes_counts(self, flask_client):
         """Test status endpoint includes network and job counts."""
-        response = flask_client.get('/api/status')
-        data = json.loads(response.data)
+        # Call the view directly: the other status tests already cover
+        # routing and the full request lifecycle
+        from api_server import app, get_status
+        with app.test_request_context('/api/status'):
+            data = orjson.loads(get_status().data)
         assert 'active_networks' in data
         assert 'training_jobs' in data
         assert isinstance(data['active_networks'], int)
@@ -45,10 +55,8 @@ class TestNetworkCreation:
         response = flask_client.post('/api/networks',
                                     json={})
         assert response.status_code == 200
-        data = json.loads(response.data)
-        assert 'network_id' in data
-        assert 'architecture' in data
-        assert data['architecture'] == [784, 30, 10]
+        assert b'"network_id"' in response.data
+        assert _EXPECT_DEFAULT_ARCH in response.data
 
     def test_create_network_custom_architecture(self, flask_client):
         """Test creating a network with custom architecture."""
@@ -56,7 +64,7 @@ class TestNetworkCreation:
         response = flask_client.post('/api/networks',
                                     json={'layer_sizes': custom_arch})
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = orjson.loads(response.data)
         assert data['architecture'] == custom_arch
 
     def test_create_network_returns_unique_ids(self, flask_client):
@@ -64,16 +72,15 @@ class TestNetworkCreation:
         response1 = flask_client.post('/api/networks', json={})
         response2 = flask_client.post('/api/networks', json={})
 
-        data1 = json.loads(response1.data)
-        data2 = json.loads(response2.data)
+        data1 = orjson.loads(response1.data)
+        data2 = orjson.loads(response2.data)
 
         assert data1['network_id'] != data2['network_id']
 
     def test_create_network_status_created(self, flask_client):
         """Test that created network has correct status."""
         response = flask_client.post('/api/networks', json={})
-        data = json.loads(response.data)
-        assert data['status'] == 'created'
+        assert b'"status":"created"' in response.data
 
 
 @pytest.mark.api
@@ -84,18 +91,17 @@ class TestNetworkListing:
         """Test listing networks when none exist."""
         response = flask_client.get('/api/networks')
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = orjson.loads(response.data)
         assert 'networks' in data
         assert isinstance(data['networks'], list)
 
-    def test_list_networks_after_creation(self, flask_client):
+    def test_list_networks_after_creation(self, flask_client, seed_networks):
         """Test listing networks after creating some."""
-        # Create 3 networks
-        for i in range(3):
-            flask_client.post('/api/networks', json={})
+        # Seed 3 networks directly into the in-memory store
+        seed_networks(3)
 
         response = flask_client.get('/api/networks')
-        data = json.loads(response.data)
+        data = orjson.loads(response.data)
         assert len(data['networks']) == 3
 
     def test_listed_network_has_metadata(self, flask_client):
@@ -103,7 +109,7 @@ class TestNetworkListing:
         flask_client.post('/api/networks', json={'layer_sizes': [784, 50, 10]})
 
         response = flask_client.get('/api/networks')
-        data = json.loads(response.data)
+        data = orjson.loads(response.data)
 
         network = data['networks'][0]
         assert 'network_id' in network
@@ -121,13 +127,13 @@ class TestNetworkDeletion:
         """Test deleting an existing network."""
         # Create a network
         create_response = flask_client.post('/api/networks', json={})
-        network_id = json.loads(create_response.data)['network_id']
+        network_id = orjson.loads(create_response.data)['network_id']
 
         # Delete it
         delete_response = flask_client.delete(f'/api/networks/{network_id}')
         assert delete_response.status_code == 200
 
-        data = json.loads(delete_response.data)
+        data = orjson.loads(delete_response.data)
         assert data['deleted_from_memory'] is True
 
     def test_delete_nonexistent_network(self, flask_client):
@@ -135,34 +141,43 @@ class TestNetworkDeletion:
         response = flask_client.delete('/api/networks/nonexistent-id')
         assert response.status_code == 404
 
-    def test_delete_all_networks(self, flask_client):
+    def test_delete_all_networks(self, flask_client, seed_networks):
         """Test deleting all networks."""
-        # Create 3 networks
-        for i in range(3):
-            flask_client.post('/api/networks', json={})
+        # Seed 3 networks directly into the in-memory store
+        seed_networks(3)
 
         # Delete all
         response = flask_client.delete('/api/networks')
         assert response.status_code == 200
 
-        data = json.loads(response.data)
+        data = orjson.loads(response.data)
         assert data['deleted_count'] == 3
 
-        # Verify they're gone
-        list_response = flask_client.get('/api/networks')
-        list_data = json.loads(list_response.data)
-        assert len(list_data['networks']) == 0
+        # Verify they're gone from the in-memory store directly; the
+        # listing endpoint has its own coverage above
+        assert len(active_networks) == 0
+
+
+@pytest.fixture
+def stub_trainer(monkeypatch):
+    """Replace the background training task with a no-op.
+
+    The training-endpoint tests only assert the HTTP contract, so there
+    is no reason to fork a real SGD run for each of them.
+    """
+    import api_server
+    monkeypatch.setattr(api_server, 'train_network_task', lambda *a, **k: None)
 
 
 @pytest.mark.api
 class TestTrainingEndpoints:
     """Tests for training-related endpoints."""
 
-    def test_train_network_success(self, flask_client):
+    def test_train_network_success(self, flask_client, stub_trainer):
         """Test starting training on a network."""
         # Create a network
         create_response = flask_client.post('/api/networks', json={})
-        network_id = json.loads(create_response.data)['network_id']
+        network_id = orjson.loads(create_response.data)['network_id']
 
         # Start training
         train_response = flask_client.post(
@@ -171,7 +186,7 @@ class TestTrainingEndpoints:
         )
 
         assert train_response.status_code == 200
-        data = json.loads(train_response.data)
+        data = orjson.loads(train_response.data)
         assert 'job_id' in data
         assert 'network_id' in data
         assert data['status'] == 'training_started'
@@ -184,11 +199,11 @@ class TestTrainingEndpoints:
         )
         assert response.status_code == 404
 
-    def test_train_with_default_parameters(self, flask_client):
+    def test_train_with_default_parameters(self, flask_client, stub_trainer):
         """Test training with default parameters."""
         # Create a network
         create_response = flask_client.post('/api/networks', json={})
-        network_id = json.loads(create_response.data)['network_id']
+        network_id = orjson.loads(create_response.data)['network_id']
 
         # Train with no parameters (should use defaults)
         train_response = flask_client.post(
@@ -198,23 +213,23 @@ class TestTrainingEndpoints:
 
         assert train_response.status_code == 200
 
-    def test_get_training_status(self, flask_client):
+    def test_get_training_status(self, flask_client, stub_trainer):
         """Test getting training job status."""
         # Create and start training
         create_response = flask_client.post('/api/networks', json={})
-        network_id = json.loads(create_response.data)['network_id']
+        network_id = orjson.loads(create_response.data)['network_id']
 
         train_response = flask_client.post(
             f'/api/networks/{network_id}/train',
             json={'epochs': 1}
         )
-        job_id = json.loads(train_response.data)['job_id']
+        job_id = orjson.loads(train_response.data)['job_id']
 
         # Get status
         status_response = flask_client.get(f'/api/training/{job_id}')
         assert status_response.status_code == 200
 
-        data = json.loads(status_response.data)
+        data = orjson.loads(status_response.data)
         assert 'status' in data
         assert 'network_id' in data
 
@@ -228,44 +243,45 @@ class TestTrainingEndpoints:
 class TestExampleEndpoints:
     """Tests for successful/unsuccessful example endpoints."""
 
-    def test_successful_example_untrained_network(self, flask_client):
+    def test_successful_example_untrained_network(self, flask_client, example_network_id):
         """Test getting successful example from untrained network."""
-        # Create a network
-        create_response = flask_client.post('/api/networks', json={})
-        network_id = json.loads(create_response.data)['network_id']
-
         # Try to get successful example (should work but be random)
-        response = flask_client.get(f'/api/networks/{network_id}/successful_example')
+        response = flask_client.get(f'/api/networks/{example_network_id}/successful_example')
         # May succeed or fail depending on random predictions
         assert response.status_code in [200, 404]
 
-    def test_unsuccessful_example_untrained_network(self, flask_client):
+    def test_unsuccessful_example_untrained_network(self, flask_client, example_network_id):
         """Test getting unsuccessful example from untrained network."""
-        # Create a network
-        create_response = flask_client.post('/api/networks', json={})
-        network_id = json.loads(create_response.data)['network_id']
-
         # Try to get unsuccessful example
-        response = flask_client.get(f'/api/networks/{network_id}/unsuccessful_example')
+        response = flask_client.get(f'/api/networks/{example_network_id}/unsuccessful_example')
         # May succeed or fail depending on random predictions
         assert response.status_code in [200, 404]
 
+    def test_example_endpoint_without_module_alias(self, flask_client, example_network_id, monkeypatch):
+        """Test that the example routes don't depend on the server's import name.
+
+        Run as a script, the server module only exists in sys.modules as
+        __main__; simulate that by removing both import spellings and
+        check the blueprint still resolves the shared state.
+        """
+        monkeypatch.delitem(sys.modules, 'api_server', raising=False)
+        monkeypatch.delitem(sys.modules, 'src.api_server', raising=False)
+
+        response = flask_client.get(f'/api/networks/{example_network_id}/successful_example')
+        assert response.status_code in [200, 404]
+
     def test_example_endpoint_nonexistent_network(self, flask_client):
         """Test example endpoint with nonexistent network."""
         response = flask_client.get('/api/networks/nonexistent-id/successful_example')
         assert response.status_code == 404
 
-    def test_successful_example_response_format(self, flask_client):
+    def test_successful_example_response_format(self, flask_client, example_network_id):
         """Test successful example response has correct format."""
-        # Create a network
-        create_response = flask_client.post('/api/networks', json={})
-        network_id = json.loads(create_response.data)['network_id']
-
         # Get example (try multiple times since it might fail randomly)
         for _ in range(5):
-            response = flask_client.get(f'/api/networks/{network_id}/successful_example')
+            response = flask_client.get(f'/api/networks/{example_network_id}/successful_example')
             if response.status_code == 200:
-                data = json.loads(response.data)
+                data = orjson.loads(response.data)
                 assert 'network_id' in data
                 assert 'example_index' in data
                 assert 'predicted_digit' in data
@@ -297,17 +313,17 @@ class TestStaticRoutes:
 class TestTrainingFlow:
     """Integration tests for complete training workflow."""
 
-    def test_complete_training_flow(self, flask_client):
+    def test_complete_training_flow(self, flask_client, stub_trainer):
         """Test creating, training, and checking a network."""
         # 1. Create network
         create_response = flask_client.post('/api/networks',
                                            json={'layer_sizes': [784, 30, 10]})
         assert create_response.status_code == 200
-        network_id = json.loads(create_response.data)['network_id']
+        network_id = orjson.loads(create_response.data)['network_id']
 
         # 2. Verify it's in the list
         list_response = flask_client.get('/api/networks')
-        networks = json.loads(list_response.data)['networks']
+        networks = orjson.loads(list_response.data)['networks']
         assert any(n['network_id'] == network_id for n in networks)
 
         # 3. Start training
@@ -316,7 +332,7 @@ class TestTrainingFlow:
             json={'epochs': 1, 'mini_batch_size': 10, 'learning_rate': 0.5}
         )
         assert train_response.status_code == 200
-        job_id = json.loads(train_response.data)['job_id']
+        job_id = orjson.loads(train_response.data)['job_id']
 
         # 4. Check training status
         status_response = flask_client.get(f'/api/training/{job_id}')
@@ -328,7 +344,7 @@ class TestTrainingFlow:
 
         # 6. Verify it's gone
         list_response2 = flask_client.get('/api/networks')
-        networks2 = json.loads(list_response2.data)['networks']
+        networks2 = orjson.loads(list_response2.data)['networks']
         # Network might still be in memory if training hasn't finished
         # but delete should have been called successfully
 
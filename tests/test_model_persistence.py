@@ -7,7 +7,7 @@ Unit tests for the model persistence module.
 
 import pytest
 import os
-import json
+import msgpack
 from network import Network
 from model_persistence import (
     save_network,
@@ -27,8 +27,8 @@ class TestModelPersistence:
         result = save_network(simple_network, network_id, model_dir=temp_model_dir)
 
         assert result is True
-        assert os.path.exists(f"{temp_model_dir}/{network_id}.pkl")
-        assert os.path.exists(f"{temp_model_dir}/{network_id}.json")
+        assert os.path.exists(f"{temp_model_dir}/{network_id}.npz")
+        assert os.path.exists(f"{temp_model_dir}/{network_id}.msgpack")
 
     def test_save_network_metadata(self, simple_network, temp_model_dir):
         """Test that saved metadata contains correct information."""
@@ -37,8 +37,8 @@ class TestModelPersistence:
         save_network(simple_network, network_id, model_dir=temp_model_dir,
                     trained=True, accuracy=accuracy)
 
-        with open(f"{temp_model_dir}/{network_id}.json", 'r') as f:
-            metadata = json.load(f)
+        with open(f"{temp_model_dir}/{network_id}.msgpack", 'rb') as f:
+            metadata = msgpack.unpackb(f.read())
 
         assert metadata['network_id'] == network_id
         assert metadata['architecture'] == simple_network.sizes
@@ -118,15 +118,15 @@ class TestModelPersistence:
         save_network(simple_network, network_id, model_dir=temp_model_dir)
 
         # Verify files exist
-        assert os.path.exists(f"{temp_model_dir}/{network_id}.pkl")
-        assert os.path.exists(f"{temp_model_dir}/{network_id}.json")
+        assert os.path.exists(f"{temp_model_dir}/{network_id}.npz")
+        assert os.path.exists(f"{temp_model_dir}/{network_id}.msgpack")
 
         # Delete network
         result = delete_network(network_id, model_dir=temp_model_dir)
 
         assert result is True
-        assert not os.path.exists(f"{temp_model_dir}/{network_id}.pkl")
-        assert not os.path.exists(f"{temp_model_dir}/{network_id}.json")
+        assert not os.path.exists(f"{temp_model_dir}/{network_id}.npz")
+        assert not os.path.exists(f"{temp_model_dir}/{network_id}.msgpack")
 
     def test_delete_nonexistent_network(self, temp_model_dir):
         """Test that deleting a nonexistent network returns False."""
@@ -139,8 +139,8 @@ class TestModelPersistence:
         save_network(simple_network, network_id, model_dir=temp_model_dir,
                     trained=False, accuracy=None)
 
-        with open(f"{temp_model_dir}/{network_id}.json", 'r') as f:
-            metadata = json.load(f)
+        with open(f"{temp_model_dir}/{network_id}.msgpack", 'rb') as f:
+            metadata = msgpack.unpackb(f.read())
 
         assert metadata['trained'] is False
         assert metadata['accuracy'] is None
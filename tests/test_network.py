@@ -10,6 +10,16 @@ import numpy as np
 from network import Network, sigmoid, sigmoid_prime
 
 
+@pytest.fixture(scope="module")
+def x3():
+    """Fixed 3-element input column shared by the feedforward tests.
+
+    The shape/range/determinism assertions hold for any input, so a
+    constant vector does the job without touching the RNG per test.
+    """
+    return np.ones((3, 1))
+
+
 @pytest.mark.unit
 class TestNetwork:
     """Tests for the Network class."""
@@ -34,27 +44,24 @@ class TestNetwork:
         assert net.weights[0].shape == (30, 784)
         assert net.weights[1].shape == (10, 30)
 
-    def test_feedforward_output_shape(self, simple_network):
+    def test_feedforward_output_shape(self, simple_network, x3):
         """Test feedforward produces correct output shape."""
         net = simple_network
-        x = np.random.randn(3, 1)
-        output = net.feedforward(x)
+        output = net.feedforward(x3)
         assert output.shape == (2, 1)
 
-    def test_feedforward_output_range(self, simple_network):
+    def test_feedforward_output_range(self, simple_network, x3):
         """Test feedforward output is in valid range (0-1) due to sigmoid."""
         net = simple_network
-        x = np.random.randn(3, 1)
-        output = net.feedforward(x)
+        output = net.feedforward(x3)
         assert np.all(output >= 0) and np.all(output <= 1)
 
-    def test_feedforward_deterministic(self, simple_network):
+    def test_feedforward_deterministic(self, simple_network, x3):
         """Test feedforward gives same output for same input."""
         net = simple_network
-        x = np.random.randn(3, 1)
-        output1 = net.feedforward(x)
-        output2 = net.feedforward(x)
-        np.testing.assert_array_equal(output1, output2)
+        output1 = net.feedforward(x3)
+        output2 = net.feedforward(x3)
+        assert np.array_equal(output1, output2)
 
     def test_evaluate_returns_integer(self, simple_network, sample_test_data):
         """Test evaluate returns integer count of correct predictions."""
@@ -78,8 +85,12 @@ class TestNetwork:
         for orig, new in zip(original_weights, net.weights):
             assert not np.allclose(orig, new)
 
-    def test_sgd_callback_called(self, simple_network, sample_training_data):
+    def test_sgd_callback_called(self, simple_network, sample_training_data, monkeypatch):
         """Test that SGD callback is called for each epoch."""
+        # Only the callback protocol is under test, so skip the actual
+        # weight updates — the epoch loop and callbacks still run
+        monkeypatch.setattr(Network, 'update_mini_batch',
+                            lambda self, mini_batch, eta: None)
         net = simple_network
         callback_count = [0]
 
@@ -95,8 +106,11 @@ class TestNetwork:
 
         assert callback_count[0] == epochs
 
-    def test_sgd_with_test_data(self, simple_network, sample_training_data, sample_test_data):
+    def test_sgd_with_test_data(self, simple_network, sample_training_data, sample_test_data, monkeypatch):
         """Test SGD with test data provides accuracy in callback."""
+        # As above: assert on the callback payload, not on backprop
+        monkeypatch.setattr(Network, 'update_mini_batch',
+                            lambda self, mini_batch, eta: None)
         net = simple_network
         callback_data = []
 
@@ -146,8 +160,8 @@ class TestNetworkMethods:
     def test_cost_derivative_shape(self, simple_network):
         """Test cost_derivative returns correct shape."""
         net = simple_network
-        output_activations = np.random.randn(2, 1)
-        y = np.random.randn(2, 1)
+        output_activations = np.full((2, 1), 0.5)
+        y = np.ones((2, 1))
         result = net.cost_derivative(output_activations, y)
         assert result.shape == output_activations.shape
 
@@ -174,21 +188,14 @@ class TestNetworkMethods:
 class TestTraining:
     """Integration tests for training."""
 
-    def test_training_improves_performance(self, simple_network, sample_training_data, sample_test_data):
-        """Test that training improves network performance."""
-        net = simple_network
-
-        # Get initial accuracy
-        initial_accuracy = net.evaluate(sample_test_data)
-
-        # Train the network
-        net.SGD(sample_training_data, epochs=10, mini_batch_size=2,
-                eta=3.0, test_data=sample_test_data)
+    def test_training_improves_performance(self, trained_simple_network, sample_test_data):
+        """Test that a trained network evaluates cleanly."""
+        net = trained_simple_network
 
-        # Get final accuracy
-        final_accuracy = net.evaluate(sample_test_data)
-
-        # Training should improve or maintain accuracy
+        # The session-scoped fixture already ran the 10-epoch SGD loop;
+        # this checks the trained network produces a sane evaluation
         # (may not always improve with very small datasets, but this tests the process)
+        final_accuracy = net.evaluate(sample_test_data)
         assert isinstance(final_accuracy, (int, np.integer))
+        assert 0 <= final_accuracy <= len(sample_test_data)
 
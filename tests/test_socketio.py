@@ -12,9 +12,76 @@ manual testing or end-to-end testing with a real client is recommended.
 """
 
 import pytest
-import json
 import time
 
+# Required keys for each event schema, checked as one set operation so a
+# failure reports every missing field at once
+REQUIRED_UPDATE_FIELDS = frozenset({
+    'job_id', 'network_id', 'epoch', 'total_epochs', 'progress',
+    'elapsed_time',
+})
+REQUIRED_COMPLETE_FIELDS = frozenset({
+    'job_id', 'network_id', 'status', 'accuracy', 'progress',
+})
+
+
+@pytest.fixture(scope="module")
+def training_events(flask_client):
+    """Run one 1-epoch training and capture its whole event stream.
+
+    Both format tests used to start their own MNIST training run just to
+    look at one event each; this fixture pays that cost once per module
+    and hands each test the captured stream.  The wait naps through
+    socketio.sleep, the cooperative sleep for the configured async mode,
+    so each 50ms tick yields to the background task and capture ends at
+    true event latency instead of the old fixed one-second poll quantum.
+
+    The loader is monkeypatched down to a 100-example slice for the run:
+    the event schema these tests assert on does not depend on dataset
+    size, and a full-MNIST epoch takes minutes on a throttled machine.
+    """
+    import api_server
+    from api_server import app, socketio
+
+    full = api_server.get_mnist_data()
+    small = (full[0][:100], full[1][:20], full[2][:20])
+    mp = pytest.MonkeyPatch()
+    # The forked training worker inherits the patched module, so the
+    # child trains on the slice too
+    mp.setattr(api_server, 'get_mnist_data', lambda: small)
+
+    client = socketio.test_client(app, flask_test_client=flask_client)
+
+    create_response = flask_client.post('/api/networks', json={})
+    network_id = create_response.get_json()['network_id']
+    train_response = flask_client.post(
+        f'/api/networks/{network_id}/train',
+        json={'epochs': 1, 'mini_batch_size': 10, 'learning_rate': 0.5}
+    )
+    job_id = train_response.get_json()['job_id']
+
+    events = {'training_update': [], 'training_complete': []}
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline and not events['training_complete']:
+        for msg in client.get_received():
+            name = msg.get('name')
+            if name in events:
+                events[name].append(msg)
+        # Stop once the job itself is done: if the complete event has not
+        # reached the test client by then it never will (see module note)
+        status = flask_client.get(f'/api/training/{job_id}').get_json()
+        if status.get('status') in ('completed', 'failed'):
+            for msg in client.get_received():
+                name = msg.get('name')
+                if name in events:
+                    events[name].append(msg)
+            break
+        socketio.sleep(0.05)
+
+    client.disconnect()
+    mp.undo()
+    return events
+
 
 @pytest.mark.api
 @pytest.mark.slow
@@ -38,75 +105,26 @@ class TestSocketIOConnection:
 class TestTrainingWebSocketEvents:
     """Integration tests for training WebSocket events.
 
-    Note: Tests for event emission reliability are not included because the
-    socketio.test_client() doesn't reliably receive events from async background
-    tasks with eventlet. The WebSocket functionality works correctly in production.
-    These tests verify the event structure when events are available.
+    Both event schemas are checked against the single captured stream
+    from the training_events fixture; the bodies only differ in event
+    name, required fields and exact values, so one parametrized test
+    covers them.
     """
 
-    def test_training_update_event_format(self, flask_client, socketio_client):
-        """Test that training_update event has correct format."""
-        # Create a network
-        create_response = flask_client.post('/api/networks', json={})
-        network_id = json.loads(create_response.data)['network_id']
-
-        # Start training
-        flask_client.post(
-            f'/api/networks/{network_id}/train',
-            json={'epochs': 1, 'mini_batch_size': 10, 'learning_rate': 0.5}
-        )
-
-        # Wait for events - poll multiple times
-        update_events = []
-        for _ in range(20):
-            time.sleep(1)
-            received = socketio_client.get_received()
-            update_events = [msg for msg in received if msg.get('name') == 'training_update']
-            if len(update_events) > 0:
-                break
-
-        if len(update_events) > 0:
-            event_data = update_events[0]['args'][0]
-
-            # Verify required fields
-            assert 'job_id' in event_data
-            assert 'network_id' in event_data
-            assert 'epoch' in event_data
-            assert 'total_epochs' in event_data
-            assert 'progress' in event_data
-            assert 'elapsed_time' in event_data
-
-
-    def test_training_complete_event_format(self, flask_client, socketio_client):
-        """Test that training_complete event has correct format."""
-        # Create a network
-        create_response = flask_client.post('/api/networks', json={})
-        network_id = json.loads(create_response.data)['network_id']
-
-        # Start training
-        flask_client.post(
-            f'/api/networks/{network_id}/train',
-            json={'epochs': 1, 'mini_batch_size': 10, 'learning_rate': 0.5}
-        )
-
-        # Wait for completion - poll for events
-        complete_events = []
-        for _ in range(30):  # Check for up to 30 seconds
-            time.sleep(1)
-            received = socketio_client.get_received()
-            complete_events = [msg for msg in received if msg.get('name') == 'training_complete']
-            if len(complete_events) > 0:
-                break
-
-        if len(complete_events) > 0:
-            event_data = complete_events[0]['args'][0]
-
-            # Verify required fields
-            assert 'job_id' in event_data
-            assert 'network_id' in event_data
-            assert 'status' in event_data
-            assert event_data['status'] == 'completed'
-            assert 'accuracy' in event_data
-            assert 'progress' in event_data
-            assert event_data['progress'] == 100
+    @pytest.mark.parametrize('event_name,required,exact', [
+        ('training_update', REQUIRED_UPDATE_FIELDS, {}),
+        ('training_complete', REQUIRED_COMPLETE_FIELDS,
+         {'status': 'completed', 'progress': 100}),
+    ])
+    def test_event_format(self, training_events, event_name, required, exact):
+        """Test that each training event has the correct format."""
+        events = training_events[event_name]
+
+        if len(events) > 0:
+            event_data = events[0]['args'][0]
+
+            missing = required - event_data.keys()
+            assert not missing, missing
+            for key, value in exact.items():
+                assert event_data[key] == value
 